@@ -1,10 +1,7 @@
 """Tools for generating fake data."""
 import sys
+from typing import List, TYPE_CHECKING
 
-if sys.version_info >= (3, 8):
-    from importlib import metadata
-else:
-    import importlib_metadata as metadata
 from . import dtrange
 from . import emitter
 from . import emitters
@@ -15,8 +12,30 @@ from . import profile
 from . import typing
 
 
-__version__ = metadata.version('fauxdoc')
 __all__ = [
     'dtrange', 'emitter', 'emitters', 'group', 'mathtools', 'mixins',
     'profile', 'typing'
 ]
+
+
+if TYPE_CHECKING:
+    __version__: str
+else:
+    # These are only defined at runtime so that type checkers don't
+    # treat every attribute of the package as valid.
+    def __getattr__(name: str) -> str:
+        # Importing `importlib.metadata` accounts for most of the time
+        # it takes to import fauxdoc, so we only do it once
+        # `__version__` is actually requested.
+        if name == '__version__':
+            if sys.version_info >= (3, 8):
+                from importlib import metadata
+            else:
+                import importlib_metadata as metadata
+            version = metadata.version('fauxdoc')
+            globals()['__version__'] = version
+            return version
+        raise AttributeError(f'module {__name__} has no attribute {name!r}')
+
+    def __dir__() -> List[str]:
+        return sorted(set(globals()) | {'__version__'})
@@ -1,23 +1,44 @@
 """Contains an implementation of a custom date/time range type."""
 from datetime import date, datetime, time, timedelta
-from typing import Optional, overload, Sequence, Tuple, TypeVar, Union
+from typing import (
+    Iterator, Optional, overload, Sequence, Tuple, TypeVar, Union
+)
 
 
 DT = TypeVar('DT', date, datetime, time)
 DTS = TypeVar('DTS', date, datetime, time, str)
 
 
+_US_PER_DAY = 86400000000
+_ONE_US = timedelta(microseconds=1)
+
+
+def _time_to_us(value: time) -> int:
+    """Converts a time value to an int number of microseconds."""
+    return (
+        ((value.hour * 60 + value.minute) * 60 + value.second) * 1000000
+        + value.microsecond
+    )
+
+
+def _us_to_time(us: int) -> time:
+    """Converts an int number of microseconds to a time value.
+
+    Values outside of one day wrap around midnight.
+    """
+    second, us = divmod(us % _US_PER_DAY, 1000000)
+    minute, second = divmod(second, 60)
+    hour, minute = divmod(minute, 60)
+    return time(hour, minute, second, us)
+
+
 def _index_to_value(index: int, start: DT, step: timedelta) -> DT:
     """Converts a 0-based index number to a date/time value."""
-    delta = step * index
     if isinstance(start, time):
-        # We can't do timedelta operations on time objects, so we have
-        # to fake it by combining the time with a reference date, doing
-        # the math, and returning the time.
-        ref_date = date(99, 1, 1)
-        ref_dt = datetime.combine(ref_date, start)
-        return (ref_dt + delta).time()
-    return start + delta
+        # We can't do timedelta operations on time objects, so we do
+        # the math on integer microseconds and wrap at midnight.
+        return _us_to_time(_time_to_us(start) + (step // _ONE_US) * index)
+    return start + step * index
 
 
 def _value_to_index(value: DT, start: DT,
@@ -94,7 +115,20 @@ class DateOrTimeRange(Sequence[DT]):
         self.length = length
         self.start = start
         self.step = step
-        self._index_range = range(0, length)
+        self._index_range: range = range(0, length)
+        # For date-only ranges, converting an index to a value is just
+        # integer math on ordinals, so we precompute what we need here
+        # instead of doing timedelta arithmetic on every access.
+        self._start_ord: Optional[int] = None
+        # Similarly, for time-only ranges we do the math on integer
+        # microseconds.
+        self._start_us: Optional[int] = None
+        if isinstance(start, time):
+            self._start_us = _time_to_us(start)
+            self._step_us = self._step // _ONE_US
+        elif not isinstance(start, datetime):
+            self._start_ord = start.toordinal()
+            self._step_days = self._step.days
 
     @property
     def start(self) -> DT:
@@ -117,7 +151,9 @@ class DateOrTimeRange(Sequence[DT]):
     def stop(self) -> DT:
         """Read-only property. Returns the 'stop' attribute."""
         if not hasattr(self, '_stop'):
-            self._stop: DT = _index_to_value(len(self), self.start, self.step)
+            self._stop: DT = _index_to_value(
+                self._length, self._start, self._step
+            )
         return self._stop
 
     @property
@@ -134,8 +170,8 @@ class DateOrTimeRange(Sequence[DT]):
             raise ValueError(
                 "Attribute 'step' must be an instance of datetime.timedelta."
             )
-        start_is_date_only = not hasattr(self.start, 'second')
-        start_is_time_only = not hasattr(self.start, 'day')
+        start_is_date_only = not isinstance(self._start, (datetime, time))
+        start_is_time_only = isinstance(self._start, time)
         if start_is_date_only and step_val.total_seconds() % 86400:
             raise ValueError(
                 "The 'step' amount is invalid for a date range lacking a time "
@@ -179,15 +215,60 @@ class DateOrTimeRange(Sequence[DT]):
         """Returns the requested value or values from the range."""
         if isinstance(index, slice):
             slc = self._index_range[index]
-            start = _index_to_value(slc.start, self.start, self.step)
-            return type(self)(start, len(slc), self.step * slc.step)
+            # Slices starting at 0 and/or with a step of 1 are common
+            # (e.g. `dtr[:10]`), and in those cases we can reuse our
+            # own start and/or step values as-is. (Except for the start
+            # of a time range, where converting drops any tzinfo.)
+            if slc.start == 0 and self._start_us is None:
+                start = self._start
+            else:
+                start = _index_to_value(slc.start, self._start, self._step)
+            step = self._step if slc.step == 1 else self._step * slc.step
+            return type(self)(start, len(slc), step)
         try:
             index_num = self._index_range[index]
         except IndexError:
             raise IndexError(f'{type(self).__name__} object index out of '
                              f'range')
+        if self._start_ord is not None:
+            # Note: mypy can't tell that `_start_ord` is only set when
+            # `_start` is a date, which has `fromordinal`.
+            ordinal = self._start_ord + self._step_days * index_num
+            value: DT = type(self._start).fromordinal(  # type: ignore
+                ordinal
+            )
+            return value
+        if self._start_us is not None:
+            time_value: DT = _us_to_time(  # type: ignore
+                self._start_us + self._step_us * index_num
+            )
+            return time_value
         return _index_to_value(index_num, self._start, self._step)
 
+    def __iter__(self) -> Iterator[DT]:
+        """Returns an iterator over the values in the range."""
+        if not self._length:
+            return
+        if isinstance(self._start, time):
+            # Time values need to wrap at midnight, so we step through
+            # them using integer microseconds.
+            us = _time_to_us(self._start)
+            step_us = self._step_us
+            for _ in self._index_range:
+                yield _us_to_time(us)
+                us += step_us
+            return
+        # For dates and datetimes, adding the step to the previous value
+        # is exact and much cheaper than converting each index. We stop
+        # short of computing the value after the last one, which may
+        # not be representable.
+        value = self._start
+        step = self._step
+        for _ in range(self._length - 1):
+            yield value
+            value += step
+        yield value
+
     def __len__(self) -> int:
         """Returns the length of the range."""
         return self._length
@@ -209,22 +290,23 @@ class DateOrTimeRange(Sequence[DT]):
         """Returns True if this range is equal to a comparison range."""
         if not isinstance(other, type(self)):
             return NotImplemented
-        my_len = len(self)
-        other_len = len(other)
-        if my_len != other_len:
+        my_len = self._length
+        if my_len != other._length:
             return False
         if my_len == 0:
             return True
-        if my_len == 1:
-            return self.start == other.start
-        return (self.start, self.step) == (other.start, other.step)
+        if self._start != other._start:
+            return False
+        return my_len == 1 or self._step == other._step
 
     def __hash__(self) -> int:
         """Returns a hash number for an instance of this type."""
-        my_len = len(self)
-        start = self.start if my_len > 0 else None
-        step = self.step if my_len > 1 else None
-        return hash((type(self), my_len, start, step))
+        if not hasattr(self, '_hash'):
+            my_len = len(self)
+            start = self.start if my_len > 0 else None
+            step = self.step if my_len > 1 else None
+            self._hash = hash((type(self), my_len, start, step))
+        return self._hash
 
     def index(self,
               value: DT,
@@ -239,22 +321,41 @@ class DateOrTimeRange(Sequence[DT]):
             stop: (Optional.) Limit your search based on this stop
                 index value.
         """
-        if isinstance(value, type(self.start)):
-            index, rem = _value_to_index(value, self._start, self._step)
-            if not rem and index in self._index_range[start:stop]:
+        index = self._find(value, start, stop)
+        if index is None:
+            raise ValueError(f'{value} is not in range')
+        return index
+
+    def _find(self,
+              value: object,
+              start: Optional[int] = None,
+              stop: Optional[int] = None) -> Optional[int]:
+        """Returns the index for a value, or None if it isn't in range.
+
+        This is the shared implementation for `index`, `__contains__`,
+        and `count`, so that checking for a value that isn't in the
+        range doesn't have to raise and catch an exception.
+        """
+        if isinstance(value, type(self._start)):
+            rem: Union[int, timedelta]
+            if (self._start_ord is not None and isinstance(value, date)
+                    and not isinstance(value, datetime)):
+                # Date-only values: do the math on ordinals directly.
+                index, rem = divmod(value.toordinal() - self._start_ord,
+                                    self._step_days)
+            else:
+                index, rem = _value_to_index(value, self._start, self._step)
+            if start is None and stop is None:
+                search_range = self._index_range
+            else:
+                search_range = self._index_range[start:stop]
+            if not rem and index in search_range:
                 return index
-        raise ValueError(f'{value} is not in range')
+        return None
 
     def __contains__(self, value: object) -> bool:
         """Returns True if a value is in this range."""
-        if isinstance(value, type(self.start)):
-            try:
-                self.index(value)
-            except ValueError:
-                pass
-            else:
-                return True
-        return False
+        return self._find(value) is not None
 
     def count(self, value: DT) -> int:
         """Returns the number of times a value occurs in this range.
@@ -262,7 +363,7 @@ class DateOrTimeRange(Sequence[DT]):
         Args:
             value: A date, time, or datetime that may be in this range.
         """
-        return 1 if value in self else 0
+        return 0 if self._find(value) is None else 1
 
 
 def _parse_user_date(val: Union[DT, str], label: str) -> DT:
@@ -271,7 +372,17 @@ def _parse_user_date(val: Union[DT, str], label: str) -> DT:
     if isinstance(val, dtypes):
         return val
     if isinstance(val, str):
-        for dtype in dtypes:
+        # We try the types in (date, time, datetime) order, but skip
+        # ones that can't possibly match, to avoid raising and catching
+        # ValueErrors needlessly. A date string never contains a ':',
+        # and only a datetime has a space or 'T' after the first char.
+        try_types: Tuple[type, ...] = dtypes
+        if ':' in val:
+            if ' ' in val or 'T' in val[1:]:
+                try_types = (datetime, time)
+            else:
+                try_types = (time, datetime)
+        for dtype in try_types:
             fromisoformat = getattr(dtype, 'fromisoformat')
             try:
                 # Note: mypy throws a no-any-return error on this, I'm
@@ -333,7 +444,8 @@ def dtrange(start: Union[DT, str], stop: Union[DT, str], step: float = 1,
         )
 
     if step_unit is None:
-        step_unit = 'seconds' if hasattr(start_obj, 'second') else 'days'
+        has_time = isinstance(start_obj, (datetime, time))
+        step_unit = 'seconds' if has_time else 'days'
 
     try:
         step_td = timedelta(**{step_unit: step})
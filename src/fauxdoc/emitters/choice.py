@@ -341,9 +341,18 @@ class Choice(RandomMixin, ItemsMixin[T], Emitter[T]):
 
     def emit(self) -> T:
         """Returns one randomly chosen value."""
-        if not self.replace:
+        if not self._replace:
             return self._choice_without_replacement(1)[0]
-        return self._choice_with_replacement(1)[0]
+        # This inlines `_choice_with_replacement(1)[0]`, which is the
+        # most common path by far, so we don't build and index a list
+        # just to return one value. (The RNG calls must stay the same,
+        # so that seeded output doesn't change.)
+        items = self._items
+        if len(items) == 1:
+            return items[0]
+        if self._weights is None:
+            return self.rng.choice(items)
+        return self.rng.choices(items, cum_weights=self._cum_weights)[0]
 
     def emit_many(self, number: int) -> List[T]:
         """Returns 'number' randomly chosen values.
@@ -1,13 +1,32 @@
 """Contains functions and emitters for emitting text data."""
-from typing import Any, Generator, Iterator, List, Optional, Sequence, Tuple
+import itertools
+from typing import Any, Iterator, List, Optional, Sequence, Tuple
 
 from fauxdoc.emitter import Emitter
 from fauxdoc.emitters import Static
-from fauxdoc.mathtools import clamp
+from fauxdoc.emitters.choice import Choice
 from fauxdoc.mixins import RandomWithChildrenMixin
 from fauxdoc.typing import EmitterLike
 
 
+_DEFAULT_UCHAR_RANGES = (
+    (0x0021, 0x0021), (0x0023, 0x0026), (0x0028, 0x007E), (0x00A1, 0x00AC),
+    (0x00AE, 0x00FF)
+)
+
+
+def _chars_in_ranges(uchar_ranges: Sequence[Tuple[int, int]]
+                     ) -> Iterator[str]:
+    """Returns an iterator over chars in the given code point ranges."""
+    return map(chr, itertools.chain.from_iterable(
+        range(start, end + 1) for (start, end) in uchar_ranges
+    ))
+
+
+# The default alphabet never changes, so we only build it once.
+_DEFAULT_ALPHABET = tuple(_chars_in_ranges(_DEFAULT_UCHAR_RANGES))
+
+
 def make_alphabet(uchar_ranges: Optional[Sequence[Tuple[int, int]]] = None
                   ) -> List[str]:
     """Generates an alphabet from provided unicode character ranges.
@@ -28,14 +47,9 @@ def make_alphabet(uchar_ranges: Optional[Sequence[Tuple[int, int]]] = None
     Returns:
         A list of characters that fall within the provided ranges.
     """
-    uchar_ranges = uchar_ranges or [
-        (0x0021, 0x0021), (0x0023, 0x0026), (0x0028, 0x007E), (0x00A1, 0x00AC),
-        (0x00AE, 0x00FF)
-    ]
-    return [
-        chr(code) for (start, end) in uchar_ranges
-        for code in range(start, end + 1)
-    ]
+    if not uchar_ranges:
+        return list(_DEFAULT_ALPHABET)
+    return list(_chars_in_ranges(uchar_ranges))
 
 
 class Word(RandomWithChildrenMixin, Emitter[str]):
@@ -93,7 +107,6 @@ class Word(RandomWithChildrenMixin, Emitter[str]):
             'length': length_emitter,
             'alphabet': alphabet_emitter
         }, rng_seed=rng_seed)
-        self._update_num_unique_vals()
 
     @property
     def length_emitter(self) -> EmitterLike[int]:
@@ -105,13 +118,25 @@ class Word(RandomWithChildrenMixin, Emitter[str]):
         """Returns the 'alphabet_emitter' attribute."""
         return self._emitters['alphabet']
 
-    def _update_num_unique_vals(self) -> None:
-        """Updates the cached number of unique values this can emit."""
-        self._num_unique_values: Optional[int] = None
+    def _calculate_num_unique_vals(self) -> Optional[int]:
+        """Calculates the number of unique values this can emit."""
         nchars = self._emitters['alphabet'].num_unique_values
         if nchars is not None and hasattr(self._emitters['length'], 'items'):
             poss_items = self._emitters['length'].items
-            self._num_unique_values = sum([nchars ** i for i in poss_items])
+            if poss_items and nchars > 1:
+                mn, mx = min(poss_items), max(poss_items)
+                if (mx - mn + 1 == len(poss_items)
+                        and len(set(poss_items)) == len(poss_items)):
+                    # When the possible lengths are a contiguous range,
+                    # the total is a geometric series, which has a
+                    # closed form that avoids computing every
+                    # (potentially huge) power.
+                    total: int = nchars ** (mx + 1) - nchars ** mn
+                    total //= nchars - 1
+                    return total
+            total = sum([nchars ** i for i in poss_items])
+            return total
+        return None
 
     def reset(self) -> None:
         """See superclass."""
@@ -126,12 +151,52 @@ class Word(RandomWithChildrenMixin, Emitter[str]):
 
     @property
     def num_unique_values(self) -> Optional[int]:
-        """Returns the max number of unique values this can emit."""
-        return self._num_unique_values
+        """Returns the max number of unique values this can emit.
+
+        This can be expensive to calculate for large alphabets and
+        word lengths, so it is calculated lazily and then cached. The
+        cached value is reused until the length emitter or its `items`
+        is replaced or the alphabet emitter's `num_unique_values`
+        changes. (As with `ItemsMixin`, changing the length emitter's
+        items sequence in place does not update it.)
+        """
+        length_em = self._emitters['length']
+        length_items = getattr(length_em, 'items', None)
+        nchars = self._emitters['alphabet'].num_unique_values
+        try:
+            cached_key, num_unique = self._unique_count_cache
+        except AttributeError:
+            pass
+        else:
+            if (cached_key[0] is length_em and cached_key[1] is length_items
+                    and cached_key[2] == nchars):
+                return num_unique
+        num_unique = self._calculate_num_unique_vals()
+        self._unique_count_cache: Tuple[Tuple[Any, Any, Optional[int]],
+                                        Optional[int]] = (
+            (length_em, length_items, nchars), num_unique
+        )
+        return num_unique
 
     def emit(self) -> str:
         """Returns one str with random chars and length."""
-        return ''.join(self._emitters['alphabet'](self._emitters['length']()))
+        length = self._emitters['length']()
+        alphabet = self._emitters['alphabet']
+        if (length > 1 and type(alphabet) is Choice
+                and len(alphabet.items) > 1
+                and alphabet.weights is None and alphabet.replace
+                and not alphabet.replace_only_after_call):
+            # For the common case of a uniform Choice alphabet with
+            # replacement, calling the alphabet emitter's `rng.choices`
+            # directly gives exactly the same result as calling the
+            # emitter, without going through several layers of method
+            # calls to get there. (Note this does not apply when length
+            # is 1, because then the Choice emitter uses `rng.choice`,
+            # or when there is only one item, which uses no RNG. It
+            # also does not apply to Choice subclasses, which may
+            # override `emit_many`.)
+            return ''.join(alphabet.rng.choices(alphabet.items, k=length))
+        return ''.join(alphabet(length))
 
     def emit_many(self, number: int) -> List[str]:
         """Returns a list of strs, ecah with random chars and length.
@@ -144,6 +209,15 @@ class Word(RandomWithChildrenMixin, Emitter[str]):
         chars = self._emitters['alphabet'](sum(lengths))
         words = []
         char_index = 0
+        joined = ''.join(chars)
+        if len(joined) == len(chars) and '' not in chars:
+            # When each "character" really is one character, slicing
+            # one joined string is faster than slicing the list of
+            # characters and joining each slice.
+            for length in lengths:
+                words.append(joined[char_index:char_index+length])
+                char_index += length
+            return words
         for length in lengths:
             words.append(''.join(chars[char_index:char_index+length]))
             char_index += length
@@ -192,7 +266,6 @@ class Text(RandomWithChildrenMixin, Emitter[str]):
             'word': word_emitter,
             'sep': sep_emitter or Static(' ')
         }, rng_seed=rng_seed)
-        self._update_num_unique_vals()
 
     @property
     def numwords_emitter(self) -> EmitterLike[int]:
@@ -209,9 +282,8 @@ class Text(RandomWithChildrenMixin, Emitter[str]):
         """Returns the 'sep_emitter' attribute."""
         return self._emitters['sep']
 
-    def _update_num_unique_vals(self) -> None:
-        """Updates the cached number of unique values this can emit."""
-        self._num_unique_values: Optional[int] = None
+    def _calculate_num_unique_vals(self) -> Optional[int]:
+        """Calculates the number of unique values this can emit."""
         numwords = self._emitters['numwords']
         word_em_has_uv = self._emitters['word'].num_unique_values is not None
         sep_em_has_uv = self._emitters['sep'].num_unique_values is not None
@@ -221,12 +293,36 @@ class Text(RandomWithChildrenMixin, Emitter[str]):
                 n_uw = self._emitters['word'].num_unique_values ** length
                 n_us = self._emitters['sep'].num_unique_values ** (length - 1)
                 nums.append(n_uw * n_us)
-            self._num_unique_values = sum(nums)
+            return sum(nums)
+        return None
 
     @property
     def num_unique_values(self) -> Optional[int]:
-        """Returns the max number of unique values this can produce."""
-        return self._num_unique_values
+        """Returns the max number of unique values this can produce.
+
+        Like `Word.num_unique_values`, this is calculated lazily and
+        then cached. The cached value is reused until the numwords
+        emitter or its `items` is replaced or the `num_unique_values`
+        of the word or sep emitter changes.
+        """
+        numwords_em = self._emitters['numwords']
+        numwords_items = getattr(numwords_em, 'items', None)
+        nwords = self._emitters['word'].num_unique_values
+        nseps = self._emitters['sep'].num_unique_values
+        try:
+            cached_key, num_unique = self._unique_count_cache
+        except AttributeError:
+            pass
+        else:
+            if (cached_key[0] is numwords_em
+                    and cached_key[1] is numwords_items
+                    and cached_key[2] == nwords and cached_key[3] == nseps):
+                return num_unique
+        num_unique = self._calculate_num_unique_vals()
+        self._unique_count_cache: Tuple[
+            Tuple[Any, Any, Optional[int], Optional[int]], Optional[int]
+        ] = ((numwords_em, numwords_items, nwords, nseps), num_unique)
+        return num_unique
 
     def reset(self) -> None:
         """See superclass."""
@@ -239,8 +335,8 @@ class Text(RandomWithChildrenMixin, Emitter[str]):
         super().seed(rng_seed)
         self._emitters.do_method('seed', self.rng_seed)
 
-    def _get_words_iterator(self, total: int) -> Iterator[str]:
-        """Creates an iterator/generator for generating words."""
+    def _get_words(self, total: int) -> List[str]:
+        """Generates the full list of words needed for `emit_many`."""
 
         # This addresses the edge case where the word_emitter for this
         # is a list of words (e.g. implemented via a Choice object),
@@ -251,27 +347,28 @@ class Text(RandomWithChildrenMixin, Emitter[str]):
         # this would be trivial. But, instead, we generate all words at
         # once and then divide them out into text values they belong
         # to, because this is way more performant. In order to address
-        # this edge case, we create a generator that resets the
-        # word_emitter each time it runs out of words; thus, words are
-        # reused, but each word appears only after all words have been
-        # emitted. Text values generated that way don't guarantee
-        # totally unique sets of words, since words might repeat if a
-        # `reset` call happens in the middle of a set of words, but
-        # this is about the best we can do I think.
-
-        if getattr(self._emitters['word'], 'replace_only_after_call', False):
-            num_unique = self._emitters['word'].num_unique_values or 0
+        # this edge case, we build the full list of `total` words in
+        # batches of at most `num_unique_values` words, resetting the
+        # word_emitter after each batch; thus, words are reused, but
+        # each word appears only after all words have been emitted.
+        # Text values generated that way don't guarantee totally unique
+        # sets of words, since words might repeat if a batch ends in the
+        # middle of a set of words, but this is about the best we can
+        # do I think.
+
+        word_em = self._emitters['word']
+        if getattr(word_em, 'replace_only_after_call', False):
+            num_unique = word_em.num_unique_values or 0
             if num_unique and total > num_unique:
-                def generator() -> Generator[str, None, None]:
-                    remainder = total
-                    while remainder > 0:
-                        needed = clamp(num_unique, mx=remainder)
-                        for word in self._emitters['word'](needed):
-                            yield word
-                        self._emitters['word'].reset()
-                        remainder -= needed
-                return generator()
-        return iter(self._emitters['word'](total))
+                batches = [num_unique] * (total // num_unique)
+                if total % num_unique:
+                    batches.append(total % num_unique)
+                words: List[str] = []
+                for needed in batches:
+                    words.extend(word_em(needed))
+                    word_em.reset()
+                return words
+        return list(word_em(total))
 
     def emit(self) -> str:
         """Returns one text str with a random # of words."""
@@ -286,12 +383,22 @@ class Text(RandomWithChildrenMixin, Emitter[str]):
         texts = []
         lengths = self._emitters['numwords'](number)
         total_words = sum(lengths)
-        words = self._get_words_iterator(total_words)
-        seps = iter(self._emitters['sep'](total_words - number))
+        words = self._get_words(total_words)
+        seps = list(self._emitters['sep'](total_words - number))
+        # Texts with 0 words are skipped, so they don't use up the
+        # separator we generate for them. Any texts beyond that get a
+        # space for each extra separator they need.
+        seps_needed = total_words - number + lengths.count(0)
+        seps.extend([' '] * (seps_needed - len(seps)))
+        word_i = sep_i = 0
         for length in lengths:
             if length:
-                render = [next(words)]
-                for _ in range(1, length):
-                    render.extend([next(seps, ' '), next(words)])
+                # Interleave words and separators by assigning slices to
+                # alternating positions, then join them all at once.
+                render = [''] * (2 * length - 1)
+                render[::2] = words[word_i:word_i + length]
+                render[1::2] = seps[sep_i:sep_i + length - 1]
                 texts.append(''.join(render))
+                word_i += length
+                sep_i += length - 1
         return texts
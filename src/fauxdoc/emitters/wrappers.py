@@ -15,8 +15,8 @@ purpose wrapper functions to do generic data conversions instead of
 hard-coding them in each and every class that might need them.
 """
 from inspect import signature, Signature
-from typing import Any, Callable, Generic, List, Mapping, Optional
-from unittest.mock import call
+from typing import Any, Callable, Generic, List, Mapping, Optional, Tuple
+from weakref import WeakKeyDictionary
 
 from fauxdoc.emitter import Emitter
 from fauxdoc.mixins import RandomWithChildrenMixin
@@ -24,6 +24,37 @@ from fauxdoc.typing import EmitterLike, ImplementsRNG, OutputT, SourceT
 from fauxdoc.warn import get_deprecated_attr
 
 
+# Introspecting a function's signature is relatively expensive, and the
+# same wrapper functions (e.g., `str`) tend to be reused across many
+# emitters, so we cache signature info. Weak keys ensure we don't keep
+# throwaway functions (such as lambdas) alive.
+_SignatureInfo = Tuple[Optional[Signature], bool]
+_SIGNATURE_CACHE: 'WeakKeyDictionary[Callable[..., Any], _SignatureInfo]'
+_SIGNATURE_CACHE = WeakKeyDictionary()
+
+
+def _get_signature_info(function: Callable[..., Any]) -> _SignatureInfo:
+    """Returns a (signature, wants_rng) tuple for a function."""
+    try:
+        return _SIGNATURE_CACHE[function]
+    except (KeyError, TypeError):
+        # KeyError means it isn't cached yet; TypeError means it can't
+        # be cached (it isn't hashable or weak-referenceable).
+        pass
+    try:
+        sig: Optional[Signature] = signature(function)
+    except ValueError:
+        # We get a ValueError if we try to use builtin methods or
+        # types, like `str`.
+        sig = None
+    info = (sig, sig is not None and 'rng' in sig.parameters)
+    try:
+        _SIGNATURE_CACHE[function] = info
+    except TypeError:
+        pass
+    return info
+
+
 class BoundWrapper(Generic[SourceT, OutputT]):
     """Utility class for user-provided wrapper functions.
 
@@ -59,6 +90,14 @@ class BoundWrapper(Generic[SourceT, OutputT]):
         wants_rng: (Read-only). True if this wrapper has an `rng` kwarg
             in its call signature and therefore expects an RNG
             (random.Random obj) to be provided.
+        direct_call: (Read-only). The most direct callable that calls
+            the wrapped function as this BoundWrapper would. If the
+            function doesn't want RNG, this is just the function;
+            otherwise it's a method that forwards `bound_to.rng`.
+            Calling this instead of the BoundWrapper instance skips the
+            `wants_rng` branch on each call. When the function doesn't
+            want RNG, it also skips a Python-level call layer; when it
+            does, `_call_with_rng` still adds one.
     """
 
     def __init__(self,
@@ -96,15 +135,10 @@ class BoundWrapper(Generic[SourceT, OutputT]):
             function: See the 'function' attribute.
         """
         self._function = function
-        try:
-            self._signature: Optional[Signature] = signature(function)
-        except ValueError:
-            # We get a ValueError if we try to use builtin methods or
-            # types, like `str`.
-            self._signature = None
-            self._wants_rng = False
-        else:
-            self._wants_rng = 'rng' in self._signature.parameters
+        self._signature, self._wants_rng = _get_signature_info(function)
+        self._direct_call: Callable[..., OutputT] = function
+        if self._wants_rng:
+            self._direct_call = self._call_with_rng
 
     @property
     def signature(self) -> Optional[Signature]:
@@ -116,11 +150,48 @@ class BoundWrapper(Generic[SourceT, OutputT]):
         """The 'wants_rng' attribute."""
         return self._wants_rng
 
+    @property
+    def direct_call(self) -> Callable[..., OutputT]:
+        """The 'direct_call' attribute."""
+        return self._direct_call
+
+    def _call_with_rng(self, *args: SourceT, **kwargs: SourceT) -> OutputT:
+        return self._function(*args, rng=self.bound_to.rng, **kwargs)
+
     def __call__(self, *args: SourceT, **kwargs: SourceT) -> OutputT:
         if self._wants_rng:
             return self._function(*args, rng=self.bound_to.rng, **kwargs)
         return self._function(*args, **kwargs)
 
+    def signature_accepts(self, *args: Any, **kwargs: Any) -> bool:
+        """Checks whether the wrapped function's signature binds args.
+
+        Unlike `try_mock_call`, this never calls the wrapped function,
+        so the values you provide don't matter -- only the number of
+        positional args and the names of the kwargs. Use this to skip
+        generating sample values for a mock call when the signature
+        alone is enough to tell that the call will work.
+
+        Args:
+            args: Sequence of positional args to bind.
+            kwargs: Mapping of kwargs to bind (NOT including `rng`,
+                which is added automatically if applicable).
+
+        Returns:
+            True if the signature is known and the args bind to it;
+            False otherwise. (E.g., this is always False for builtins,
+            whose signatures cannot be determined.)
+        """
+        if self._signature is None:
+            return False
+        if self._wants_rng:
+            kwargs['rng'] = None
+        try:
+            self._signature.bind(*args, **kwargs)
+        except TypeError:
+            return False
+        return True
+
     def try_mock_call(self, *args: Any, **kwargs: Any) -> None:
         """Tests the wrapped function signature by trying a mock call.
 
@@ -146,6 +217,9 @@ class BoundWrapper(Generic[SourceT, OutputT]):
             else:
                 self._signature.bind(*args, **kwargs)
         except TypeError as e:
+            # `unittest.mock` is slow to import and is only needed to
+            # format this error message, so we import it here.
+            from unittest.mock import call
             call_str = str(call(*args, **kwargs))[4:]
             raise TypeError(
                 f'The callback provided to {type(self.bound_to).__name__} '
@@ -254,6 +328,7 @@ class WrapOne(Generic[SourceT, OutputT], RandomWithChildrenMixin,
             rng_seed: See 'rng_seed' attribute.
         """
         super().__init__(children={'source': source}, rng_seed=rng_seed)
+        self._checked: Tuple[Any, ...] = ()
         self.set_wrapper_function(wrapper)
 
     def set_wrapper_function(self, function: Callable[..., OutputT]) -> None:
@@ -280,8 +355,19 @@ class WrapOne(Generic[SourceT, OutputT], RandomWithChildrenMixin,
         Args:
             wrapper: See the 'wrapper' attribute.
         """
+        # If we've already checked this function, or if the signature
+        # tells us everything we need to know, we can skip emitting a
+        # sample value from the source for a mock call. We still reset
+        # either way, so that setting a wrapper always restarts the
+        # emitter. A function we've checked must be rechecked if the
+        # source emitter it was checked against is replaced.
+        checked = (wrapper.function, id(self._emitters['source']))
+        needs_mock_call = not (checked == self._checked
+                               or wrapper.signature_accepts(None))
         try:
-            wrapper.try_mock_call(self._emitters['source']())
+            if needs_mock_call:
+                wrapper.try_mock_call(self._emitters['source']())
+                self._checked = checked
         except TypeError:
             raise
         finally:
@@ -290,7 +376,11 @@ class WrapOne(Generic[SourceT, OutputT], RandomWithChildrenMixin,
 
     def emit(self) -> OutputT:
         """Returns an emitted value, run through `self.wrapper`."""
-        return self._wrapper(self._emitters['source']())
+        # Calling the BoundWrapper's `direct_call` skips a branch for
+        # each emitted value (and, when RNG isn't needed, a layer of
+        # function calls). We look it up on each call rather than
+        # storing it, so that changes to `wrapper.function` apply.
+        return self._wrapper.direct_call(self._emitters['source']())
 
     def emit_many(self, number: int) -> List[OutputT]:
         """Returns a list of emitted, wrapped values.
@@ -298,7 +388,8 @@ class WrapOne(Generic[SourceT, OutputT], RandomWithChildrenMixin,
         Args:
             number: See superclass (Emitter).
         """
-        return [self._wrapper(v) for v in self._emitters['source'](number)]
+        call = self._wrapper.direct_call
+        return [call(v) for v in self._emitters['source'](number)]
 
 
 class WrapMany(Generic[SourceT, OutputT], RandomWithChildrenMixin,
@@ -360,6 +451,7 @@ class WrapMany(Generic[SourceT, OutputT], RandomWithChildrenMixin,
             None. The wrapper makes it impossible to know.
         """
         super().__init__(children=sources, rng_seed=rng_seed)
+        self._checked: Tuple[Any, ...] = ()
         self.set_wrapper_function(wrapper)
 
     def set_wrapper_function(self, function: Callable[..., OutputT]) -> None:
@@ -386,9 +478,21 @@ class WrapMany(Generic[SourceT, OutputT], RandomWithChildrenMixin,
         Args:
             wrapper: See the 'wrapper' attribute.
         """
-        kwargs = {k: v() for k, v in self._emitters.items()}
+        # Whether a call works depends on the source labels, too, so a
+        # function we've checked must be rechecked if those change.
+        checked = (wrapper.function, tuple(self._emitters.keys()))
+        # See WrapOne.wrapper: no need for sample values from the
+        # sources if we've already checked this function or the
+        # signature tells us the call will work.
+        needs_mock_call = not (
+            checked == self._checked
+            or wrapper.signature_accepts(**dict.fromkeys(self._emitters))
+        )
         try:
-            wrapper.try_mock_call(**kwargs)
+            if needs_mock_call:
+                kwargs = {k: v() for k, v in self._emitters.items()}
+                wrapper.try_mock_call(**kwargs)
+                self._checked = checked
         except TypeError:
             raise
         finally:
@@ -398,7 +502,8 @@ class WrapMany(Generic[SourceT, OutputT], RandomWithChildrenMixin,
     def emit(self) -> OutputT:
         """Returns an emitted value, run through `self.wrapper`."""
         kwargs = {k: em() for k, em in self._emitters.items()}
-        return self._wrapper(**kwargs)
+        # See WrapOne.emit.
+        return self._wrapper.direct_call(**kwargs)
 
     def emit_many(self, number: int) -> List[OutputT]:
         """Returns a list of emitted, wrapped values.
@@ -406,11 +511,15 @@ class WrapMany(Generic[SourceT, OutputT], RandomWithChildrenMixin,
         Args:
             number: See superclass (Emitter).
         """
-        emdata = [(k, em(number)) for k, em in self._emitters.items()]
-        return [
-            self._wrapper(**{k: v[i] for k, v in emdata})
-            for i in range(number)
-        ]
+        call = self._wrapper.direct_call
+        if not self._emitters:
+            return [call() for _ in range(number)]
+        # Each source emits one column of values; zipping the columns
+        # gives us each row of values without reindexing every column
+        # for every row.
+        keys = tuple(self._emitters.keys())
+        columns = [em(number) for em in self._emitters.values()]
+        return [call(**dict(zip(keys, row))) for row in zip(*columns)]
 
 
 DEPRECATED = {
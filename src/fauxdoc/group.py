@@ -1,8 +1,8 @@
 """Contains classes for grouping and operating on groups of objects."""
 from abc import ABC, abstractmethod
-from typing import Any, Generic, Iterable, Mapping
+from typing import Any, Dict, Generic, Iterable, Mapping
 
-from fauxdoc.typing import OrderedDict, T, UserList
+from fauxdoc.typing import T, UserList
 
 
 class GroupMixin(Generic[T], ABC):
@@ -32,6 +32,8 @@ class GroupMixin(Generic[T], ABC):
             attr_name: The name of the attribute to set.
             attr_value: The value to set.
         """
+        # `setattr` alone would add missing attributes rather than
+        # raise, so the `hasattr` check is what makes this skip them.
         for obj in self.objects_iterable:
             if obj is not None and hasattr(obj, attr_name):
                 setattr(obj, attr_name, attr_value)
@@ -84,11 +86,12 @@ class ObjectGroup(GroupMixin[T], UserList[T]):
         return self
 
 
-class ObjectMap(GroupMixin[T], OrderedDict[str, T]):
+class ObjectMap(GroupMixin[T], Dict[str, T]):
     """Class for operating on groups of similar objects (as a dict).
 
     Use this instead of ObjectGroup when you need your group to behave
-    like a dict.
+    like a dict. (It is a plain dict subclass: insertion order is
+    preserved, but equality comparisons ignore order.)
 
     This provides a shorthand way to set the same attribute or call the
     same method on a group of objects, where some objects in the group
@@ -107,5 +110,10 @@ class ObjectMap(GroupMixin[T], OrderedDict[str, T]):
 
     @property
     def objects_iterable(self) -> Iterable[T]:
-        """Iterates through the objects in this group."""
-        return list(self.values())
+        """Iterates through the objects in this group.
+
+        This is a tuple snapshot of the map's values, so member objects
+        may safely add or remove entries from the map during a group
+        operation.
+        """
+        return tuple(self.values())
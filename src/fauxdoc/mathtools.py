@@ -6,6 +6,25 @@ from typing import List, Optional, Sequence
 from fauxdoc.typing import F, T
 
 
+_SQRT_2PI = math.sqrt(2 * math.pi)
+
+# Factorials are cached in a table that grows as needed, since poisson
+# is normally called for each x in a range of consecutive integers.
+# Past 170!, the factorial overflows a float anyway.
+_FACTORIALS = [1]
+_MAX_CACHED_FACTORIAL = 170
+
+
+def _factorial(n: int) -> int:
+    """Returns n!, using the module-level cache when possible."""
+    if not isinstance(n, int) or n < 0 or n > _MAX_CACHED_FACTORIAL:
+        return math.factorial(n)
+    table = _FACTORIALS
+    while len(table) <= n:
+        table.append(table[-1] * len(table))
+    return table[n]
+
+
 def poisson(x: int, mu: float = 1) -> float:
     """Applies a poisson probability distribution function.
 
@@ -19,7 +38,7 @@ def poisson(x: int, mu: float = 1) -> float:
         A float value representing a probability that the given x value
         might occur.
     """
-    return (mu ** x) * (math.exp(-1 * mu)) / math.factorial(x)
+    return (mu ** x) * math.exp(-mu) / _factorial(x)
 
 
 def gaussian(x: float, mu: float = 0, sigma: float = 1) -> float:
@@ -37,9 +56,8 @@ def gaussian(x: float, mu: float = 0, sigma: float = 1) -> float:
         A float value representing the relative probability that a
         random variable would be approximately x.
     """
-    term1 = math.exp(-1 * (((x - mu) / sigma) ** 2) / 2)
-    term2 = 1 / (math.sqrt(2 * math.pi) * sigma)
-    return term1 * term2
+    z = (x - mu) / sigma
+    return math.exp(-(z * z) / 2) * (1 / (_SQRT_2PI * sigma))
 
 
 def clamp(number: F, mn: Optional[F] = None, mx: Optional[F] = None) -> F:
@@ -104,11 +122,12 @@ def weighted_shuffle(items: Sequence[T],
         weights = list(weights)
         positions = range(len(items))
         sample: List[T] = []
+        choices = rng.choices
         while True:
             needed = k - len(sample)
             if not needed:
                 break
-            for i in rng.choices(positions, weights, k=needed):
+            for i in choices(positions, weights, k=needed):
                 # Duplicates: a weight of 0 indicates something has
                 # been selected already, letting us skip duplicates.
                 # Zeroing out weights of selected items also ensures
@@ -127,17 +146,25 @@ def weighted_shuffle(items: Sequence[T],
         # score for each item based on weight, and then reverse sort
         # by score. Having to operate on the full list makes this
         # slower for lower values of k, but the lack of iteration makes
-        # it scale very well for higher values of k. Zipping the scores
-        # and items is faster than tracking positions.
-        scores = zip((math.log(rng.random()) / w for w in weights), items)
+        # it scale very well for higher values of k.
+        # Binding these to locals saves two attribute lookups per item.
+        log, rand = math.log, rng.random
+        scores = [log(rand()) / w for w in weights]
 
         # Note: to pick the highest scoring k items, reverse sorting
         # the whole list is faster than using the `heapq.nlargest`
         # method shown in the referenced StackOverflow post. The latter
         # is only faster for very small k values, where the brute force
-        # low_k approach is much faster anyway.
-        top_n = sorted(scores, reverse=True, key=lambda x: x[0])[:k]
-        return [item for _, item in top_n]
+        # low_k approach is much faster anyway. Sorting positions using
+        # `scores.__getitem__` as the key (i.e., an argsort) is faster
+        # than sorting (score, item) pairs, since it avoids creating
+        # and unpacking a tuple for each item; it also lets us skip
+        # slicing when we need every item.
+        positions = sorted(range(len(scores)), key=scores.__getitem__,
+                           reverse=True)
+        if k < len(positions):
+            positions = positions[:k]
+        return [items[i] for i in positions]
 
     nitems = len(items)
     nweights = len(weights)
@@ -1,6 +1,6 @@
 """Contains mixin classes."""
 import random
-from typing import Any, Generic, Sequence
+from typing import Any, Generic, Sequence, Tuple
 
 from fauxdoc.group import ObjectMap
 from fauxdoc.typing import EmitterLike, T
@@ -91,8 +91,26 @@ class ItemsMixin(Generic[T]):
 
     @property
     def num_unique_values(self) -> int:
-        """Returns an int, the number of unique values emittable."""
-        return len(set(self._items))
+        """Returns an int, the number of unique values emittable.
+
+        Counting unique items means building a set from all of them,
+        so the count is cached until `_items` is replaced or its length
+        changes. (Note that changing items in place without changing
+        the length of the sequence does not update it.)
+        """
+        items = self._items
+        try:
+            cached_items, cached_len, num_unique = self._unique_count_cache
+        except AttributeError:
+            pass
+        else:
+            if cached_items is items and cached_len == len(items):
+                return num_unique
+        num_unique = len(set(items))
+        self._unique_count_cache: Tuple[Sequence[T], int, int] = (
+            items, len(items), num_unique
+        )
+        return num_unique
 
 
 class ChildrenMixin:
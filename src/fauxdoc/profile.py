@@ -1,5 +1,5 @@
 """Contains classes for creating faux-data-generation profiles."""
-from typing import Any, Dict, Generic, List, Optional, Union
+from typing import Any, Dict, Generic, List, Optional, Tuple, Union
 
 from fauxdoc.group import ObjectMap
 from fauxdoc.emitters.fixed import Static
@@ -134,9 +134,23 @@ class Field(RandomWithChildrenMixin, Generic[T]):
     @property
     def multi_valued(self) -> bool:
         """See the 'multi_valued' attribute."""
-        if hasattr(self.repeat_emitter, 'items'):
-            return bool(self.repeat_emitter.items != [None])
-        return True
+        # This is checked often (e.g., by CopyFields, for every value
+        # it emits), so we only recalculate it if the repeat emitter or
+        # its items have been replaced since the last check.
+        repeat = self._emitters['repeat']
+        items = getattr(repeat, 'items', None)
+        try:
+            cached_repeat, cached_items, multi_valued = self._multi_valued
+        except AttributeError:
+            pass
+        else:
+            if cached_repeat is repeat and cached_items is items:
+                return multi_valued
+        multi_valued = items is None or bool(items != [None])
+        self._multi_valued: Tuple[Any, Any, bool] = (
+            repeat, items, multi_valued
+        )
+        return multi_valued
 
     @property
     def previous(self) -> Any:
@@ -191,8 +205,13 @@ class Field(RandomWithChildrenMixin, Generic[T]):
             generates the one value. If `gate_emitter` returns False,
             then this returns None.
         """
-        if self.gate_emitter():
-            self._cache = self.emitter(self.repeat_emitter())
+        # This runs once per field per record, so we skip the emitter
+        # properties and look up the emitters in the child map directly.
+        # (Binding them to attributes wouldn't be safe: they can be
+        # swapped out through `emitters` without using the setters.)
+        emitters = self._emitters
+        if emitters['gate']():
+            self._cache = emitters['emitter'](emitters['repeat']())
         else:
             self._cache = None
         return self._cache
@@ -119,6 +119,21 @@ def test_dateortimerange_items_as_list(start, length, step, expected):
     assert list(dtrange.DateOrTimeRange(start, length, step)) == expected
 
 
+@pytest.mark.parametrize('start, length, step', [
+    (date(2016, 1, 1), 0, timedelta(days=1)),
+    (date(2016, 1, 1), 100, timedelta(days=3)),
+    (date(2016, 1, 1), 100, timedelta(days=-7)),
+    (date(9999, 12, 29), 3, timedelta(days=1)),
+    (datetime(2016, 1, 1, 12, 0), 100, timedelta(hours=-5, microseconds=3)),
+    (datetime(9999, 12, 31, 23, 59), 2, timedelta(seconds=30)),
+    (time(23, 0), 100, timedelta(minutes=1, microseconds=1)),
+])
+def test_dateortimerange_iteration_matches_indexing(start, length, step):
+    dtr = dtrange.DateOrTimeRange(start, length, step)
+    assert list(dtr) == [dtr[i] for i in range(length)]
+    assert list(reversed(dtr)) == list(dtr)[::-1]
+
+
 @pytest.mark.parametrize('start, length, step, index, expected', [
     (date(2016, 1, 1), 6, timedelta(days=1), 0, date(2016, 1, 1)),
     (date(2016, 1, 1), 6, timedelta(days=1), -1, date(2016, 1, 6)),
@@ -206,6 +221,9 @@ def test_dateortimerange_equality_and_hash(range_one, range_two, expected):
     (date(2016, 1, 1), 6, timedelta(days=1), date(2015, 12, 31), None),
     (date(2016, 1, 1), 6, timedelta(days=2), date(2016, 1, 3), 1),
     (date(2016, 1, 1), 6, timedelta(days=2), date(2016, 1, 2), None),
+    (date(2016, 1, 1), 6, timedelta(days=-2), date(2015, 12, 28), 2),
+    (date(2016, 1, 1), 6, timedelta(days=-2), date(2015, 12, 29), None),
+    (date(2016, 1, 1), 6, timedelta(days=-2), date(2016, 1, 3), None),
     (time(8, 0), 5, timedelta(hours=1), time(10, 0), 2),
     (time(8, 0), 5, timedelta(hours=1), time(8, 30), None),
     (datetime(2016, 1, 1, 8, 0), 5, timedelta(hours=1), time(8, 30), None),
@@ -228,6 +246,16 @@ def test_dateortimerange_find_index_by_item(start, length, step, search_val,
         assert dtr.count(search_val) == 1
 
 
+def test_dateortimerange_find_index_within_bounds():
+    dtr = dtrange.DateOrTimeRange(date(2016, 1, 1), 6, timedelta(days=1))
+    assert dtr.index(date(2016, 1, 3), 1, 4) == 2
+    assert dtr.index(date(2016, 1, 3), -4) == 2
+    with pytest.raises(ValueError):
+        dtr.index(date(2016, 1, 3), 3)
+    with pytest.raises(ValueError):
+        dtr.index(date(2016, 1, 3), None, 2)
+
+
 @pytest.mark.parametrize('start, stop, step, step_unit, exp_err_str', [
     ('2016/1/1', '2016/1/5', 1, 'days', "Cannot decipher 'start' argument"),
     ('2016-01-01', '2016/1/5', 1, 'days', "Cannot decipher 'stop' argument"),
@@ -269,6 +297,10 @@ def test_dtrange_validation(start, stop, step, step_unit, exp_err_str):
     ('2015-12-31T23:59:58', '2016-01-01T00:00:02', 1, None,
      [datetime(2015, 12, 31, 23, 59, 58), datetime(2015, 12, 31, 23, 59, 59),
       datetime(2016, 1, 1, 0, 0, 0), datetime(2016, 1, 1, 0, 0, 1)]),
+    ('2015-12-31 23:59:58', '2016-01-01 00:00:00', 1, None,
+     [datetime(2015, 12, 31, 23, 59, 58), datetime(2015, 12, 31, 23, 59, 59)]),
+    ('2015-12-31T00:00', '2016-01-01 00:00', 12, 'hours',
+     [datetime(2015, 12, 31, 0, 0), datetime(2015, 12, 31, 12, 0)]),
 ])
 def test_dtrange_return_value(start, stop, step, step_unit, expected):
     dtr = dtrange.dtrange(start, stop, step, step_unit)
@@ -184,6 +184,18 @@ def test_sequential_set_iterator_factory():
     assert em(5) == [5, 6, 4, 5, 6]
 
 
+def test_sequential_num_unique_values_tracks_items_changes():
+    items = [1, 2]
+    em = fixed.Sequential(items)
+    assert em.num_unique_values == 2
+    items.append(3)
+    assert em.num_unique_values == 3
+    # This will throw a deprecation warning, which we ignore here:
+    with warnings.catch_warnings(record=True):
+        em.iterator_factory = lambda: iter([4, 5, 5, 6, 7])
+    assert em.num_unique_values == 4
+
+
 def test_sequential_set_nonseq_iterator_factory_raises_error():
     em = fixed.Sequential([1, 2, 3])
     _ = em()
@@ -1,4 +1,6 @@
 """Contains tests for the fauxdoc.emitters.text module."""
+from unittest.mock import Mock
+
 import pytest
 
 from fauxdoc.emitters.choice import Choice
@@ -38,6 +40,14 @@ def test_makealphabet(ranges, expected):
     assert make_alphabet(ranges) == expected
 
 
+def test_makealphabet_default_returns_new_list_each_time():
+    alphabet = make_alphabet()
+    assert alphabet[0] == '!' and alphabet[-1] == '\u00ff'
+    alphabet.append('extra')
+    assert make_alphabet() == alphabet[:-1]
+    assert make_alphabet([]) == alphabet[:-1]
+
+
 @pytest.mark.parametrize(
     'seed, mn, mx, lweights, alpha, aweights, num, repeat, expected', [
         (999, 0, 0, None, 'abcde', None, 10, 0,
@@ -76,6 +86,32 @@ def test_word_emit(seed, mn, mx, lweights, alpha, aweights, num, repeat,
     assert result == expected
 
 
+@pytest.mark.parametrize('alphabet, number, expected', [
+    (['ab', 'cd'], 3, ['abcd', 'cdab', 'abab']),
+    (['ab', ''], 3, ['ab', 'ab', 'abab']),
+])
+def test_word_emit_multicharacter_alphabet(alphabet, number, expected):
+    we = Word(Static(2), Choice(alphabet), rng_seed=1)
+    assert we(number) == expected
+
+
+def test_word_emit_uses_choice_subclass_emit_many():
+    class UpperChoice(Choice):
+        def emit_many(self, number):
+            return [c.upper() for c in super().emit_many(number)]
+
+    we = Word(Static(3), UpperChoice('abc'), rng_seed=1)
+    assert we().isupper()
+
+
+def test_word_emit_single_item_alphabet_does_not_use_rng():
+    alphabet = Choice('a')
+    we = Word(Static(3), alphabet, rng_seed=1)
+    state = alphabet.rng.getstate()
+    assert we() == 'aaa'
+    assert alphabet.rng.getstate() == state
+
+
 @pytest.mark.parametrize('len_choices, alphabet, exp_num_unique', [
     ([1], 'abcde', 5),
     ([2], 'abcde', 25),
@@ -83,6 +119,10 @@ def test_word_emit(seed, mn, mx, lweights, alpha, aweights, num, repeat,
     ([4], 'abcde', 625),
     ([1, 2, 3, 4], 'abcde', 5 + 25 + 125 + 625),
     ([3, 1], 'abcde', 125 + 5),
+    ([3, 1, 2], 'abcde', 125 + 5 + 25),
+    ([2, 2, 3], 'abcde', 25 + 25 + 125),
+    ([2, 3], 'a', 2),
+    (range(1, 21), 'abcde', sum(5 ** i for i in range(1, 21))),
 ])
 def test_word_unique_properties(len_choices, alphabet, exp_num_unique):
     length_emitter = Choice(len_choices)
@@ -92,6 +132,22 @@ def test_word_unique_properties(len_choices, alphabet, exp_num_unique):
     assert not we.emits_unique_values
 
 
+def test_word_num_unique_values_with_no_lengths():
+    we = Word(Mock(items=[]), Choice('abcde'))
+    assert we.num_unique_values == 0
+
+
+def test_word_num_unique_values_tracks_child_changes():
+    we = Word(Static(2), Choice('abcde'))
+    assert we.num_unique_values == 25
+    we.length_emitter.value = 3
+    assert we.num_unique_values == 125
+    we.emitters['length'] = Choice([1, 2])
+    assert we.num_unique_values == 5 + 25
+    we.emitters['alphabet'] = Choice('ab')
+    assert we.num_unique_values == 2 + 4
+
+
 @pytest.mark.parametrize(
     'seed, word_mn, word_mx, word_weights, sep_chars, sep_weights, num, '
     'repeat, expected', [
@@ -181,6 +237,16 @@ def test_text_emit_words_list(seed, word_mn, word_mx, unique, num, repeat,
     assert result == expected
 
 
+def test_text_word_emitter_reconfigured_after_init():
+    word_em = Choice(['a', 'b', 'c'])
+    te = Text(Static(5), word_em, rng_seed=1)
+    word_em.replace_only_after_call = True
+    result = te(3)
+    assert len(result) == 3
+    for text in result:
+        assert len(text.split(' ')) == 5
+
+
 @pytest.mark.parametrize(
     'word_emitter, sep_choices, numwords_choices, exp_unique_vals', [
         (Word(Static(1), Choice('abcde')), None, [1], 5),
@@ -217,3 +283,14 @@ def test_text_unique_properties(word_emitter, sep_choices, numwords_choices,
     )
     assert te.num_unique_values == exp_unique_vals
     assert not te.emits_unique_values
+
+
+def test_text_num_unique_values_tracks_child_changes():
+    te = Text(Static(2), Choice('abc'))
+    assert te.num_unique_values == 9
+    te.numwords_emitter.value = 3
+    assert te.num_unique_values == 27
+    te.emitters['sep'] = Choice([' ', '-'])
+    assert te.num_unique_values == 27 * 4
+    te.emitters['word'] = Word(Static(2), Choice('ab'))
+    assert te.num_unique_values == (4 ** 3) * 4
@@ -42,6 +42,28 @@ def test_boundwrapper_setting_function_sets_signature():
     assert True
 
 
+def test_boundwrapper_reuses_signature_for_same_function():
+    def func(val, rng):
+        return f'{val}'
+
+    wrapper_a = BoundWrapper(func, Mock())
+    wrapper_b = BoundWrapper(func, Mock())
+    assert wrapper_a.signature is wrapper_b.signature
+    assert wrapper_a.wants_rng and wrapper_b.wants_rng
+
+
+def test_boundwrapper_unhashable_callable():
+    class UnhashableCallable:
+        __hash__ = None
+
+        def __call__(self, val, rng):
+            return f'{val}'
+
+    wrapper = BoundWrapper(UnhashableCallable(), Mock())
+    wrapper.signature.bind(1, rng=None)
+    assert wrapper.wants_rng
+
+
 def test_boundwrapper_can_init_other_boundwrapper():
     def func(val):
         return f'{val}'
@@ -78,6 +100,23 @@ def test_boundwrapper_call_w_rng():
     em.rng.randint.assert_called_once_with(1, 5)
 
 
+def test_boundwrapper_directcall_no_rng():
+    def func(val):
+        return f'{val}'
+
+    wrapper = BoundWrapper(func, object())
+    assert wrapper.direct_call is func
+    assert wrapper.direct_call(1) == '1'
+
+
+def test_boundwrapper_directcall_w_rng():
+    em = Mock()
+    em.rng.randint.side_effect = lambda a, b: 1
+    wrapper = BoundWrapper(lambda val, rng: f'{val} {rng.randint(1, 5)}', em)
+    assert wrapper.direct_call('a') == 'a 1'
+    em.rng.randint.assert_called_once_with(1, 5)
+
+
 def test_boundwrapper_call_missing_expected_rng_raises_error():
     em = object()  # no rng attribute
     wrapper = BoundWrapper(lambda val, rng: f'{val} {rng.randint(1, 5)}', em)
@@ -113,6 +152,21 @@ def test_boundwrapper_trymockcall_fails():
     assert '(1, 2) raised a TypeError' in error_msg
 
 
+@pytest.mark.parametrize('function, args, kwargs, expected', [
+    (lambda val: val, [1], {}, True),
+    (lambda val, rng: val, [1], {}, True),
+    (lambda a, b: a, [], {'a': 1, 'b': 2}, True),
+    (lambda a, b, rng: a, [], {'a': 1, 'b': 2}, True),
+    (lambda val: val, [1, 2], {}, False),
+    (lambda val: val, [], {'a': 1}, False),
+    (lambda a, b: a, [], {'a': 1}, False),
+    (str, [1], {}, False),
+])
+def test_boundwrapper_signatureaccepts(function, args, kwargs, expected):
+    wrapper = BoundWrapper(function, Mock())
+    assert wrapper.signature_accepts(*args, **kwargs) == expected
+
+
 @pytest.mark.parametrize('source, wrapper, expected', [
     (Static(1000), str, ['1000']),
     (NumberEmitter(), str, ['0', '1', '2', '3', '4', '5', '6', '7']),
@@ -181,6 +235,46 @@ def test_wrapone_init_and_reset_do_reset_source_emitter():
     mock_em.reset.assert_has_calls([call(), call(), call()])
 
 
+@pytest.mark.parametrize('wrapper, exp_num_source_calls', [
+    (lambda n: None, 0),
+    (lambda n, rng: None, 0),
+    (str, 1),
+])
+def test_wrapone_init_only_mock_calls_source_if_needed(wrapper,
+                                                       exp_num_source_calls):
+    mock_em = Mock()
+    WrapOne(mock_em, wrapper)
+    assert mock_em.call_count == exp_num_source_calls
+
+
+def test_wrapone_resetting_same_wrapper_function_skips_mock_call():
+    mock_em = Mock(return_value=1)
+    wrapped_em = WrapOne(mock_em, str)
+    num_resets = mock_em.reset.call_count
+    assert mock_em.call_count == 1
+    wrapped_em.set_wrapper_function(str)
+    assert mock_em.call_count == 1
+    assert mock_em.reset.call_count == num_resets + 1
+    wrapped_em.set_wrapper_function(int)
+    assert mock_em.call_count == 2
+    new_mock_em = Mock(return_value=1)
+    wrapped_em.emitters['source'] = new_mock_em
+    wrapped_em.set_wrapper_function(int)
+    assert new_mock_em.call_count == 1
+
+
+@pytest.mark.parametrize('wrapper', [str, lambda n: str(n)])
+def test_wrapone_setting_wrapper_restarts_seeded_output(wrapper):
+    wrapped_em = WrapOne(Choice(range(100)), wrapper, rng_seed=1)
+    expected = wrapped_em(5)
+    wrapped_em.set_wrapper_function(wrapper)
+    assert wrapped_em(5) == expected
+    wrapped_em.set_wrapper_function(lambda n: str(n))
+    assert wrapped_em(5) == expected
+    wrapped_em.set_wrapper_function(str)
+    assert wrapped_em(5) == expected
+
+
 def test_wrapone_seed_does_seed_source_emitter():
     mock_em = Mock()
     wrapped_em = WrapOne(mock_em, lambda n: None)
@@ -198,6 +292,16 @@ def test_wrapone_wrapper_is_settable():
     assert wrapped_em.wrapper.bound_to == wrapped_em
 
 
+def test_wrapone_changing_wrapper_function_takes_effect():
+    wrapped_em = WrapOne(Static(1), lambda val: 'old')
+    assert wrapped_em() == 'old'
+    wrapped_em.wrapper.function = lambda val: 'new'
+    assert wrapped_em() == 'new'
+    assert wrapped_em(2) == ['new', 'new']
+    wrapped_em.wrapper.function = lambda val, rng: rng is wrapped_em.rng
+    assert wrapped_em()
+
+
 def test_wrapone_setting_wrapper_w_invalid_callable_raises_error():
     em = Static(1)
     wrapped_em = WrapOne(em, lambda val: None)
@@ -290,6 +394,32 @@ def test_wrapmany_seed_seeds_all_source_emitters():
         m.seed.assert_called_once_with(999)
 
 
+def test_wrapmany_resetting_same_wrapper_function_skips_mock_call():
+    mock_ems = {'one': Mock()}
+    wrapped_em = WrapMany(mock_ems, dict)
+    num_resets = mock_ems['one'].reset.call_count
+    assert mock_ems['one'].call_count == 1
+    wrapped_em.set_wrapper_function(dict)
+    assert mock_ems['one'].call_count == 1
+    assert mock_ems['one'].reset.call_count == num_resets + 1
+    wrapped_em.emitters['two'] = Mock()
+    wrapped_em.set_wrapper_function(dict)
+    assert mock_ems['one'].call_count == 2
+    assert wrapped_em.emitters['two'].call_count == 1
+
+
+@pytest.mark.parametrize('wrapper', [dict, lambda one: {'one': one}])
+def test_wrapmany_setting_wrapper_restarts_seeded_output(wrapper):
+    wrapped_em = WrapMany({'one': Choice(range(100))}, wrapper, rng_seed=1)
+    expected = wrapped_em(5)
+    wrapped_em.set_wrapper_function(wrapper)
+    assert wrapped_em(5) == expected
+    wrapped_em.set_wrapper_function(lambda one: {'one': one})
+    assert wrapped_em(5) == expected
+    wrapped_em.set_wrapper_function(dict)
+    assert wrapped_em(5) == expected
+
+
 def test_wrapmany_wrapper_is_settable():
     ems = {'one': Static(1), 'two': Static(2)}
     wrapped_em = WrapMany(ems, lambda one, two: None)
@@ -300,6 +430,14 @@ def test_wrapmany_wrapper_is_settable():
     assert wrapped_em.wrapper.bound_to == wrapped_em
 
 
+def test_wrapmany_changing_wrapper_function_takes_effect():
+    wrapped_em = WrapMany({'one': Static(1)}, lambda one: 'old')
+    assert wrapped_em() == 'old'
+    wrapped_em.wrapper.function = lambda one: 'new'
+    assert wrapped_em() == 'new'
+    assert wrapped_em(2) == ['new', 'new']
+
+
 def test_wrapmany_setting_wrapper_w_invalid_callable_raises_error():
     ems = {'one': Static(1), 'two': Static(2)}
     wrapped_em = WrapMany(ems, lambda one, two: None)
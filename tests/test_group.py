@@ -104,3 +104,15 @@ def test_objectmap_domethod(emitters):
             assert not hasattr(obj, 'mock_method')
         else:
             assert obj is None
+
+
+def test_objectmap_domethod_callee_can_change_map():
+    group = ObjectMap({'first': Static('foo'), 'second': Static('bar')})
+
+    def add_to_group(value):
+        group[f'added_{value}'] = Static(value)
+
+    for em in group.values():
+        em.add_to_group = add_to_group
+    group.do_method('add_to_group', 'baz')
+    assert set(group.keys()) == {'first', 'second', 'added_baz'}
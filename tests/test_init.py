@@ -0,0 +1,25 @@
+"""Contains tests for the top-level fauxdoc package."""
+import subprocess
+import sys
+
+import pytest
+
+import fauxdoc
+
+
+def test_version_is_available():
+    assert isinstance(fauxdoc.__version__, str)
+    assert '__version__' in dir(fauxdoc)
+
+
+def test_version_is_loaded_lazily():
+    code = ('import sys, fauxdoc; '
+            'print("importlib.metadata" in sys.modules)')
+    result = subprocess.run([sys.executable, '-c', code],
+                            capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == 'False'
+
+
+def test_missing_attribute_raises_error():
+    with pytest.raises(AttributeError):
+        fauxdoc.not_an_attribute
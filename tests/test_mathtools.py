@@ -1,4 +1,5 @@
 """Contains tests for the fauxdoc data.math module."""
+import math
 import random
 
 import pytest
@@ -19,6 +20,17 @@ def test_poisson(x, mu, expected):
     assert round(m.poisson(x, mu), 4) == expected
 
 
+@pytest.mark.parametrize('n', [0, 1, 2, 5, 20, 170, 171, 200])
+def test_factorial(n):
+    assert m._factorial(n) == math.factorial(n)
+
+
+@pytest.mark.parametrize('n', [-1, 1.5])
+def test_factorial_invalid(n):
+    with pytest.raises((TypeError, ValueError)):
+        m._factorial(n)
+
+
 @pytest.mark.parametrize('x, mu, sigma, expected', [
     (0, 1, 1, 0.242),
     (1, 1, 1, 0.3989),
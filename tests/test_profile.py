@@ -215,6 +215,17 @@ def test_field_multivalued_attribute(field, expected):
     assert field.multi_valued == expected
 
 
+def test_field_multivalued_attribute_tracks_repeat_emitter_changes():
+    field = Field('test', Static('test'))
+    assert not field.multi_valued
+    field.repeat_emitter.value = 2
+    assert field.multi_valued
+    field.repeat_emitter = Static(None)
+    assert not field.multi_valued
+    field.emitters['repeat'] = choice.Choice(range(1, 5))
+    assert field.multi_valued
+
+
 def test_field_multivalued_attribute_is_readonly():
     field = Field('test', Static('test'))
     with pytest.raises(AttributeError):